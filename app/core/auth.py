@@ -16,28 +16,37 @@ Functions:
     enforce_auth_or_display_sign_in: Main authentication flow handler
     get_auth_url: Generate the authorization URL for user sign-in
     handle_auth_code: Handle the authentication code received from the identity provider
-    get_token_from_code: Retrieve an access token using the authorization code
+    get_token_from_code: Redeem the authorization code for tokens
     decode_token: Decode a JWT token without verifying the signature
     get_tenant_id_from_token: Extract the tenant ID from an access token
     is_allowed_tenant: Check if a given tenant ID is in the list of allowed tenants
+    get_user_info_from_claims: Build user information from ID token claims
     get_user_info: Retrieve user information from the Microsoft Graph API
+    graph_batch: Send several Microsoft Graph GET requests in a single $batch call
     display_sign_in_screen: Render the sign-in UI
     display_invalid_tenant_screen: Render the invalid tenant error screen
 
 Dependencies:
     - msal: Microsoft Authentication Library for Python
     - requests: HTTP library for making API calls
-    - jwt: JSON Web Token implementation
+    - orjson: Fast JSON parser used for token payloads
     - streamlit: Used for creating the user interface
     - app.core.session_manager: Manages user session data
 """
 
 # Standard imports
+import binascii
 import logging
+import threading
+import orjson
 import streamlit as st
-import requests
-import jwt
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+# msal and requests are imported lazily on first use to keep cold start fast
+if TYPE_CHECKING:
+    import requests
+    from msal import ConfidentialClientApplication
 
 
 # Core imports
@@ -45,11 +54,33 @@ from app.core.config import config
 from app.core.session_manager import SessionManager
 
 
-# Logging setup
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Logging setup (handlers and level are configured once in app.main)
+logger = logging.getLogger(__name__)
+
+# Maps URL-safe base64 characters to the standard alphabet understood by binascii
+_B64URL_TO_STD = bytes.maketrans(b"-_", b"+/")
+
+# Sign-in button markup shared by the sign-in and invalid tenant screens
+_AUTH_BUTTON_TMPL = """
+<a href='{url}' target='_self'>
+    <button style='background-color: teal; color: white; border: none; border-radius: 4px; padding: 8px 16px; font-size: 18px; cursor: pointer;'>
+        {label}
+    </button>
+</a>
+"""
+
+# Shared MSAL client, built lazily on first use by _get_msal_app()
+_msal_app: Optional["ConfidentialClientApplication"] = None
+_msal_app_lock = threading.Lock()
+
+# Microsoft Graph endpoints; $batch accepts at most 20 sub-requests per call
+GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+GRAPH_BATCH_LIMIT = 20
+GRAPH_TIMEOUT = (3, 10)  # (connect, read) timeouts in seconds
+
+# Shared Graph HTTP session, built lazily on first use by _get_graph_session()
+_graph_session: Optional["requests.Session"] = None
+_graph_session_lock = threading.Lock()
 
 
 def enforce_auth_or_display_sign_in() -> bool:
@@ -62,10 +93,12 @@ def enforce_auth_or_display_sign_in() -> bool:
     Returns:
         bool: True if the user is authenticated, False otherwise.
     """
+    # Fast path for reruns after login. This must stay a per-session lookup: st.session_state
+    # is a process-wide proxy, so keying a module-level cache on it would be shared by all users.
     if SessionManager.is_authenticated():
         return True
 
-    query_params = st.query_params.to_dict()
+    query_params = st.query_params  # Query the proxy directly; to_dict() would copy it every rerun
     if "code" in query_params:
         return handle_auth_code(query_params["code"])
     else:
@@ -79,10 +112,13 @@ def handle_auth_code(auth_code: str) -> bool:
     Handle the authentication code received from the identity provider.
 
     This function performs the following steps:
-    1. Obtains an access token using the authorization code.
-    2. Extracts the tenant ID from the token.
+    1. Redeems the authorization code for an access token and ID token.
+    2. Reads the tenant ID from the ID token claims.
     3. Checks if the tenant is allowed.
-    4. If allowed, retrieves the user information and initializes the session.
+    4. If allowed, builds the user information and initializes the session.
+
+    The ID token claims returned by MSAL already carry the tenant and user identity, so
+    the access token is only decoded, and Microsoft Graph only called, when they are missing.
 
     Args:
         auth_code (str): The authentication code received from the identity provider.
@@ -90,21 +126,24 @@ def handle_auth_code(auth_code: str) -> bool:
     Returns:
         bool: True if authentication is successful, False otherwise.
     """
-    access_token = get_token_from_code(auth_code)
+    token_result = get_token_from_code(auth_code)
     st.query_params.clear()  # Clear query parameters after processing
 
-    if not access_token:
+    if not token_result:
         st.error("Authentication failed.")
         return False
 
-    tenant_id = get_tenant_id_from_token(access_token)
-    print(f"Tenant ID: {tenant_id}")
-    print(f"Allowed Tenants: {config.ALLOWED_TENANTS}")
+    access_token = token_result["access_token"]
+    id_token_claims = token_result.get("id_token_claims") or {}
+
+    tenant_id = id_token_claims.get("tid") or get_tenant_id_from_token(access_token)
+    logger.debug("Tenant ID: %s", tenant_id)
+    logger.debug("Allowed Tenants: %s", config.ALLOWED_TENANTS)
     if not is_allowed_tenant(tenant_id):
         display_invalid_tenant_screen()
         return False
 
-    user_info = get_user_info(access_token)
+    user_info = get_user_info_from_claims(id_token_claims) or get_user_info(access_token)
     if not user_info:
         st.error("Failed to retrieve user information.")
         return False
@@ -124,15 +163,8 @@ def display_sign_in_screen() -> None:
     st.subheader("Azure Fed Demo Platform")
     st.write("Welcome to the Microsoft Azure Fed Demo Platform. Please sign in with an authorized account.")
 
-    auth_url = get_auth_url()
     st.markdown(
-        f"""
-        <a href='{auth_url}' target='_self'>
-            <button style='background-color: teal; color: white; border: none; border-radius: 4px; padding: 8px 16px; font-size: 18px; cursor: pointer;'>
-                Sign In
-            </button>
-        </a>
-        """,
+        _AUTH_BUTTON_TMPL.format(url=get_auth_url(), label="Sign In"),
         unsafe_allow_html=True,
     )
 
@@ -146,68 +178,91 @@ def display_invalid_tenant_screen() -> None:
     st.write("This application is only available to specific Microsoft tenants.")
     st.write("If you believe this is an error, please contact your administrator.")
 
-    auth_url = get_auth_url()
     st.markdown(
-        f"""
-        <a href='{auth_url}' target='_self'>
-            <button style='background-color: teal; color: white; border: none; border-radius: 4px; padding: 8px 16px; font-size: 18px; cursor: pointer;'>
-                Sign In with a Different Account
-            </button>
-        </a>
-        """,
+        _AUTH_BUTTON_TMPL.format(url=get_auth_url(), label="Sign In with a Different Account"),
         unsafe_allow_html=True,
     )
 
 
+def _get_msal_app() -> "ConfidentialClientApplication":
+    """
+    Return the shared MSAL client, creating it on first use.
+
+    Building a ConfidentialClientApplication makes a blocking tenant-discovery call, so a
+    single instance is reused for both sign-in URLs and code redemption. Its token cache
+    keeps nothing: the app never acquires tokens silently, and a shared cache would hold
+    every signed-in user's refresh tokens for the life of the process.
+
+    Returns:
+        ConfidentialClientApplication: The process-wide MSAL client.
+    """
+    global _msal_app
+    if _msal_app is None:
+        with _msal_app_lock:
+            if _msal_app is None:
+                from msal import ConfidentialClientApplication, TokenCache
+
+                class _NoStoreTokenCache(TokenCache):
+                    """Token cache that discards every token MSAL tries to add."""
+
+                    def add(self, event, **kwargs):
+                        pass
+
+                _msal_app = ConfidentialClientApplication(
+                    client_id=config.APP_CLIENT_ID,
+                    authority=config.MSAL_AUTHORITY,
+                    client_credential=config.APP_CLIENT_SECRET,
+                    token_cache=_NoStoreTokenCache()
+                )
+    return _msal_app
+
+
+@lru_cache(maxsize=1)
 def get_auth_url() -> str:
     """
     Generate the authorization URL for user sign-in.
 
+    The URL only depends on static configuration, so it is built once per process and
+    reused by the sign-in screens on every Streamlit rerun.
+
     Returns:
         str: The authorization URL for the user to initiate the sign-in process.
     """
-    from msal import ConfidentialClientApplication
-
-    app = ConfidentialClientApplication(
-        client_id=config.APP_CLIENT_ID,
-        authority=config.MSAL_AUTHORITY,
-        client_credential=config.APP_CLIENT_SECRET
-    )
+    app = _get_msal_app()
     auth_url = app.get_authorization_request_url(
-        scopes=config.MSAL_SCOPES,
+        scopes=list(config.MSAL_SCOPES),  # MSAL requires a list; config holds a tuple
         redirect_uri=config.MSAL_REDIRECT_URI
     )
-    logging.debug(f"Generated auth URL: {auth_url}")
+    logger.debug("Generated auth URL: %s", auth_url)
     return auth_url
 
 
-def get_token_from_code(auth_code: str) -> Optional[str]:
+def get_token_from_code(auth_code: str) -> Optional[Dict[str, Any]]:
     """
-    Retrieve an access token using the authorization code.
+    Redeem the authorization code for tokens.
 
     Args:
         auth_code (str): The authorization code received after user sign-in.
 
     Returns:
-        Optional[str]: The access token if successful, None otherwise.
+        Optional[Dict[str, Any]]: The MSAL token result if successful, None otherwise. It
+            holds the "access_token" and, when available, the decoded "id_token_claims".
     """
-    from msal import ConfidentialClientApplication
-
-    app = ConfidentialClientApplication(
-        client_id=config.APP_CLIENT_ID,
-        authority=config.MSAL_AUTHORITY,
-        client_credential=config.APP_CLIENT_SECRET
-    )
+    app = _get_msal_app()
     try:
         result = app.acquire_token_by_authorization_code(
             auth_code,
-            scopes=config.MSAL_SCOPES,
+            scopes=list(config.MSAL_SCOPES),  # MSAL requires a list; config holds a tuple
             redirect_uri=config.MSAL_REDIRECT_URI
         )
-        return result.get("access_token")
     except Exception as e:
-        logging.error(f"Error getting token from code: {e}")
+        logger.error("Error getting token from code: %s", e)
+        return None
+
+    if not result.get("access_token"):
+        logger.error("Error getting token from code: %s", result.get("error_description"))
         return None
+    return result
 
 
 def get_tenant_id_from_token(access_token: str) -> Optional[str]:
@@ -224,7 +279,7 @@ def get_tenant_id_from_token(access_token: str) -> Optional[str]:
         decoded_token = decode_token(access_token)
         return decoded_token['tid']
     except Exception as e:
-        logging.error(f"Error extracting tenant ID from token: {e}")
+        logger.error("Error extracting tenant ID from token: %s", e)
         return None
 
 
@@ -241,29 +296,170 @@ def is_allowed_tenant(tenant_id: str) -> bool:
     return tenant_id in config.ALLOWED_TENANTS
 
 
+def get_user_info_from_claims(id_token_claims: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Build user information from ID token claims.
+
+    The object ID (`oid`) is the user's stable identity and is stored under Graph's `id`
+    key; `name` maps to Graph's `displayName`. `preferred_username` is display-only and
+    mutable (often an email, and not the UPN for guest users), so it keeps its claim name.
+
+    Args:
+        id_token_claims (Dict[str, Any]): The decoded ID token claims returned by MSAL.
+
+    Returns:
+        Optional[Dict[str, Any]]: The user's id, displayName and preferred_username, or None
+            if the claims do not identify the user.
+    """
+    if not id_token_claims.get("oid"):
+        return None
+
+    return {
+        "id": id_token_claims["oid"],
+        "displayName": id_token_claims.get("name"),
+        "preferred_username": id_token_claims.get("preferred_username"),
+    }
+
+
 def get_user_info(access_token: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve user information from the Microsoft Graph API.
 
+    The lookup goes through graph_batch so additional profile reads (photo, groups, etc.)
+    can be added as extra sub-requests rather than separate HTTPS calls.
+
     Args:
         access_token (str): The access token to use for authentication.
 
     Returns:
         Optional[Dict[str, Any]]: User information if successful, None otherwise.
     """
-    headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get("https://graph.microsoft.com/v1.0/me", headers=headers)
-    if response.status_code == 200:
-        return response.json()
+    responses = graph_batch(_get_graph_session(), access_token, [
+        {"id": "me", "method": "GET", "url": "/me"}
+    ])
+    me = responses.get("me")
+    if me and me.get("status") == 200:
+        return me.get("body")
     else:
-        logging.error(f"Error fetching user info: {response.text}")
+        logger.error("Error fetching user info: %s", me.get('body') if me else 'no response')
         return None
 
 
+def _get_graph_session() -> "requests.Session":
+    """
+    Return the shared Microsoft Graph HTTP session, creating it on first use.
+
+    The session pools keep-alive connections so repeated Graph calls skip the TLS
+    handshake. POST is retried too: $batch only wraps read-only GET sub-requests,
+    so replaying it is safe.
+
+    Returns:
+        requests.Session: The process-wide Graph session.
+    """
+    global _graph_session
+    if _graph_session is None:
+        with _graph_session_lock:
+            if _graph_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=20,
+                        max_retries=Retry(
+                            total=2,
+                            backoff_factor=0.2,
+                            status_forcelist=[429, 502, 503, 504],
+                            allowed_methods=frozenset({"GET", "POST"})
+                        )
+                    )
+                )
+                _graph_session = session
+    return _graph_session
+
+
+def graph_batch(
+    session: "requests.Session", access_token: str, requests_list: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Send Microsoft Graph requests through the JSON batching endpoint.
+
+    Sub-requests are grouped into $batch calls of at most GRAPH_BATCH_LIMIT entries,
+    so N reads cost one round trip per group instead of one per read.
+
+    Args:
+        session (requests.Session): The HTTP session to send the batch with.
+        access_token (str): The access token to use for authentication.
+        requests_list (List[Dict[str, Any]]): Sub-requests, each with "id", "method" and a
+            Graph-relative "url" (e.g. "/me").
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Sub-responses keyed by request id. Each holds the
+            "status", "headers" and "body" returned by Graph. Ids from a batch call that
+            fails (non-200 status, transport error or malformed body) are logged and missing
+            from the result; other batch calls are unaffected. Sub-responses without an "id"
+            are skipped.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for start in range(0, len(requests_list), GRAPH_BATCH_LIMIT):
+        chunk = requests_list[start:start + GRAPH_BATCH_LIMIT]
+        for item in _send_graph_batch(session, headers, chunk):
+            results[item["id"]] = item
+
+    return results
+
+
+def _send_graph_batch(
+    session: "requests.Session", headers: Dict[str, str], chunk: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Send a single $batch call to Microsoft Graph.
+
+    Args:
+        session (requests.Session): The HTTP session to send the batch with.
+        headers (Dict[str, str]): The request headers, including authorization.
+        chunk (List[Dict[str, Any]]): At most GRAPH_BATCH_LIMIT sub-requests.
+
+    Returns:
+        List[Dict[str, Any]]: The sub-responses that carry an "id", or an empty list if the
+            call returned a non-200 status, failed in transport or its body was not a JSON
+            object with a "responses" list.
+    """
+    import requests
+
+    try:
+        response = session.post(
+            f"{GRAPH_BASE_URL}/$batch", json={"requests": chunk}, headers=headers, timeout=GRAPH_TIMEOUT
+        )
+        if response.status_code != 200:
+            logger.error("Error sending Graph batch request: %s", response.text)
+            return []
+        body = response.json()
+    except (requests.RequestException, ValueError) as e:
+        # Exhausted retries, timeouts, connection errors and non-JSON bodies
+        logger.error("Error sending Graph batch request: %s", e)
+        return []
+
+    responses = body.get("responses") if isinstance(body, dict) else None
+    if not isinstance(responses, list):
+        logger.error("Malformed Graph batch response: %s", response.text)
+        return []
+    return [item for item in responses if isinstance(item, dict) and "id" in item]
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode a JWT token without verifying the signature.
 
+    The payload segment is parsed directly with binascii + orjson, since without signature
+    verification PyJWT adds nothing but option handling and a second header parse.
+
     Args:
         token (str): The JWT token to decode.
 
@@ -271,11 +467,25 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: The decoded token claims if successful, None otherwise.
     """
     try:
-        algorithm = jwt.get_unverified_header(token)["alg"]
-        decoded_token = jwt.decode(
-            token, algorithms=[algorithm], options={"verify_signature": False}
-        )
-        return decoded_token
+        _, payload_b64, _ = token.split(".")
+        return orjson.loads(_b64url_decode(payload_b64))
     except Exception as e:
-        logging.error(f"Error decoding token: {e}")
+        logger.error("Error decoding token: %s", e)
         return None
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """
+    Decode an unpadded base64url segment, as used in JWTs.
+
+    Translates to the standard alphabet and calls the C-level binascii decoder directly,
+    skipping the Python wrapper around it in base64.urlsafe_b64decode.
+
+    Args:
+        segment (str): The base64url-encoded segment.
+
+    Returns:
+        bytes: The decoded bytes.
+    """
+    data = segment.encode("ascii").translate(_B64URL_TO_STD)
+    return binascii.a2b_base64(data + b"=" * (-len(data) % 4))
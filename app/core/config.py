@@ -8,7 +8,8 @@ lists, and other common types.
 Instructions:
     1. Create a `.env` file in the root of the project.
     2. Add the environment variables to the `.env` file.
-    3. Adjust the init to include your boolean, list, and dictionary keys.
+    3. Adjust the init to include your boolean, list, and dictionary keys. Add list keys that
+       are only used for membership checks to the set keys as well to store them as frozensets.
     4. Use the ConfigService to access the configuration values.
 
 Usage:
@@ -24,11 +25,38 @@ Usage:
 # Imports   
 # -----------------------------------------------------------------------------------------------------------
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
-from typing import Any, List
+from typing import Any, FrozenSet, List
 import json
 
 
+# Values treated as true for boolean keys
+_TRUE_VALUES = frozenset({'true', '1', 't'})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return an immutable equivalent of a configuration value.
+
+    Lists become tuples, dictionaries become read-only mappings and sets become frozensets,
+    recursively, so nested values cannot be changed through the shared config either.
+
+    Args:
+        value (Any): The configuration value to freeze.
+
+    Returns:
+        Any: The frozen value.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
 # -----------------------------------------------------------------------------------------------------------
 # Configuration Service Definition
 # -----------------------------------------------------------------------------------------------------------
@@ -38,54 +66,93 @@ class ConfigService:
 
     This service loads all environment variables from a `.env` file and makes
     them accessible as attributes. It also supports type conversions for
-    booleans, lists, and dictionaries.
+    booleans, lists, and dictionaries. The service is read-only once initialized,
+    including nested values: lists are exposed as tuples and dictionaries as read-only
+    mappings, so it can be shared across sessions and threads without locking.
     """
     def __init__(self):
         """
         Initialize the ConfigService by loading environment variables.
         """
         load_dotenv()  # Load environment variables from the .env file
-        self._config = {key: value for key, value in os.environ.items()}
+        self._config = os.environ.copy()
 
         # Define keys that require special type conversions
         self._boolean_keys = ['DEBUG']
         self._list_keys = ['ALLOWED_ORIGINS', 'ALLOWED_TENANTS', 'MSAL_SCOPES']
+        self._set_keys = {'ALLOWED_TENANTS'}  # List keys used only for membership tests
         self._dict_keys = ['API_SETTINGS']
 
+        # Map each typed key to its converter, so conversion is a single pass
+        self._converters = {key: self._to_bool for key in self._boolean_keys}
+        self._converters.update(
+            {key: self._to_set if key in self._set_keys else self._to_list for key in self._list_keys}
+        )
+        self._converters.update({key: self._to_dict for key in self._dict_keys})
+
         # Perform type conversions
-        self._convert_booleans()
-        self._convert_lists()
-        self._convert_dicts()
+        self._convert_types()
 
         # Dynamically set MSAL_REDIRECT_URI based on the detected environment
         self._set_msal_redirect_uri()
 
-    def _convert_booleans(self):
+        # Make every value immutable before it is shared
+        self._config = {key: _freeze(value) for key, value in self._config.items()}
+
+        # Expose settings as real attributes so reads skip the __getattr__ fallback
+        self._promote_attributes()
+
+        # Freeze the configuration against further changes
+        self._config = MappingProxyType(self._config)
+        self._frozen = True
+
+    def _convert_types(self):
         """
-        Convert specific keys to boolean values.
+        Convert the boolean, list, set, and dictionary keys that are present in one pass.
         """
-        for key in self._boolean_keys:
+        for key, convert in self._converters.items():
             if key in self._config:
-                self._config[key] = self._config[key].lower() in ('true', '1', 't')
+                self._config[key] = convert(key, self._config[key])
 
-    def _convert_lists(self):
+    @staticmethod
+    def _to_bool(key: str, value: str) -> bool:
         """
-        Convert specific keys to list values.
+        Convert a value to a boolean.
         """
-        for key in self._list_keys:
-            if key in self._config:
-                self._config[key] = [item.strip() for item in self._config[key].split(',') if item.strip()]
+        return value.lower() in _TRUE_VALUES
 
-    def _convert_dicts(self):
+    @staticmethod
+    def _to_list(key: str, value: str) -> List[str]:
         """
-        Convert specific keys to dictionary values.
+        Convert a comma-separated value to a list, dropping empty items.
         """
-        for key in self._dict_keys:
-            if key in self._config:
-                try:
-                    self._config[key] = json.loads(self._config[key])
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON format for '{key}': {e}")
+        return [item for item in map(str.strip, value.split(',')) if item]
+
+    @staticmethod
+    def _to_set(key: str, value: str) -> FrozenSet[str]:
+        """
+        Convert a comma-separated value to a frozenset.
+
+        Used for list keys that are only used for membership tests, giving O(1) lookups
+        and an immutable value that is safe to share across threads.
+        """
+        return frozenset(item for item in map(str.strip, value.split(',')) if item)
+
+    @staticmethod
+    def _to_dict(key: str, value: str) -> Any:
+        """
+        Convert a JSON value to a dictionary.
+
+        Uses the standard library parser rather than orjson: this runs once at startup, and
+        orjson would turn integers wider than 64 bits into floats and reject NaN/Infinity.
+
+        Raises:
+            ValueError: If the value is not valid JSON.
+        """
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format for '{key}': {e}")
 
     def _set_msal_redirect_uri(self):
         """
@@ -106,10 +173,46 @@ class ConfigService:
         # Azure App Service sets the WEBSITE_INSTANCE_ID environment variable
         return 'WEBSITE_INSTANCE_ID' in self._config
 
+    def _promote_attributes(self):
+        """
+        Store each configuration value as an instance attribute.
+
+        Attribute reads then resolve through the instance dictionary instead of calling
+        `__getattr__`. Private names and names that would shadow class members (such as
+        `get`) are skipped and remain reachable through `__getattr__` and `get()`.
+        """
+        for key, value in self._config.items():
+            if not key.startswith('_') and not hasattr(type(self), key):
+                object.__setattr__(self, key, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Reject attribute assignment once the configuration has been loaded.
+
+        Raises:
+            AttributeError: If the configuration is already frozen.
+        """
+        if self.__dict__.get('_frozen', False):
+            raise AttributeError(f"Cannot set '{name}': configuration is read-only.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Reject attribute deletion once the configuration has been loaded.
+
+        Raises:
+            AttributeError: If the configuration is already frozen.
+        """
+        if self.__dict__.get('_frozen', False):
+            raise AttributeError(f"Cannot delete '{name}': configuration is read-only.")
+        object.__delattr__(self, name)
+
     def __getattr__(self, name: str) -> Any:
         """
         Access configuration values as attributes.
 
+        Only called for names not promoted to instance attributes by `_promote_attributes`.
+
         Args:
             name (str): The name of the configuration setting to access.
 
@@ -119,10 +222,10 @@ class ConfigService:
         Raises:
             AttributeError: If the configuration setting does not exist.
         """
-        try:
-            return self._config[name]
-        except KeyError:
-            raise AttributeError(f"Configuration setting '{name}' not found.")
+        config = self._config
+        if name in config:
+            return config[name]
+        raise AttributeError(f"Configuration setting '{name}' not found.")
 
     def get(self, key: str, default: Any = None) -> Any:
         """
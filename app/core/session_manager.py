@@ -17,13 +17,19 @@ Dependencies:
 """
 
 # Standard library imports
+import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 # Streamlit imports
 import streamlit as st
 
+logger = logging.getLogger(__name__)
+
+# Keys cleared from the session state on logout
+_SESSION_KEYS = ('user_info', 'is_authenticated', 'session_log_info')
+
 #***********************************************************************************************
 # SessionManager class
 #***********************************************************************************************
@@ -45,7 +51,8 @@ class SessionManager:
 
         Args:
             access_token (str): The access token for the user.
-            user_info (dict): Dictionary containing user information.
+            user_info (dict): Dictionary containing user information. See `get_user_info`
+                for the keys it is guaranteed to contain.
         """
 
         # Store the access token in the session state
@@ -56,7 +63,7 @@ class SessionManager:
         st.session_state.is_authenticated = True
 
         # Example debug log
-        print(f"User authenticated: {user_info.get('username')}")
+        logger.debug("User authenticated: %s", user_info.get('id'))
 
     @staticmethod
     def clear_session() -> None:
@@ -66,29 +73,38 @@ class SessionManager:
         This method is typically called during logout to remove all user-specific data
         from the session state.
         """
-        # List of keys to be cleared from the session state
-        keys_to_clear = ['user_info', 'is_authenticated', 'session_log_info']
-        
         # Remove each key from the session state if it exists
-        for key in keys_to_clear:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _SESSION_KEYS:
+            st.session_state.pop(key, None)
 
     @staticmethod
     def is_authenticated() -> bool:
         """
         Check if a user is currently authenticated.
 
+        This is checked on every rerun, so it uses a single subscript on the session state
+        rather than `.get()`, which takes a longer path through Streamlit's proxy.
+
         Returns:
             bool: True if a user is authenticated, False otherwise.
         """
-        return st.session_state.get('is_authenticated', False)
+        try:
+            return st.session_state['is_authenticated']
+        except KeyError:
+            return False
 
     @staticmethod
     def get_user_info() -> Dict[str, Any]:
         """
         Retrieve the current user's information.
 
+        At sign-in the user information is normally built from the ID token claims, so
+        only `id` (the user's object ID), `displayName` and `preferred_username` are
+        guaranteed. The full Microsoft Graph `/me` profile (`mail`, `givenName`, `surname`,
+        `jobTitle`, ...) is only present when the claims were incomplete and Graph was
+        called instead; consumers needing those fields should fetch them through
+        `app.core.auth.get_user_info`.
+
         Returns:
             dict: The current user's information if available, None otherwise.
         """
@@ -107,8 +123,9 @@ class SessionManager:
         Returns:
             dict: Session log information including user ID, session ID, and start time.
         """
+        user_id = user_info.get("id")
         return {
-            "user_id": user_info.get("username"),
-            "session_id": f'{user_info.get("username")}_{uuid.uuid4()}',
-            "session_start": datetime.now().isoformat()
+            "user_id": user_id,
+            "session_id": f"{user_id}_{uuid.uuid4().hex}",
+            "session_start": datetime.now(timezone.utc).isoformat()
         }
@@ -31,6 +31,7 @@ sys.path.insert(0, str(project_root))
 
 # Utility imports
 import asyncio
+import logging
 
 # Streamlit imports
 import streamlit as st
@@ -54,7 +55,7 @@ from app.core.auth import enforce_auth_or_display_sign_in
 # -----------------------------------------------------------------------------------------------------------
 def configure_streamlit():
     """
-    Configure Streamlit page settings.
+    Configure Streamlit page settings and application logging.
     """
     st.set_page_config(
         page_title=config.APP_NAME,
@@ -68,6 +69,13 @@ def configure_streamlit():
         }
     )
 
+    # Configure root logging once per process; later reruns find the handler already installed
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=config.LOG_LEVEL,
+            format="%(asctime)s - %(levelname)s - %(message)s"
+        )
+
 
 # -----------------------------------------------------------------------------------------------------------
 # Main application flow